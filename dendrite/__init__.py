@@ -1,18 +1,24 @@
+import importlib
+import importlib.util
 import sys
+from typing import TYPE_CHECKING
+
 from loguru import logger
-from dendrite.async_api import (
-    AsyncDendrite,
-    AsyncElement,
-    AsyncPage,
-    AsyncElementsResponse,
-)
-
-from dendrite.sync_api import (
-    Dendrite,
-    Element,
-    Page,
-    ElementsResponse,
-)
+
+if TYPE_CHECKING:
+    from dendrite.async_api import (
+        AsyncDendrite,
+        AsyncElement,
+        AsyncPage,
+        AsyncElementsResponse,
+    )
+
+    from dendrite.sync_api import (
+        Dendrite,
+        Element,
+        Page,
+        ElementsResponse,
+    )
 
 logger.remove()
 
@@ -21,6 +27,35 @@ fmt = "<green>{time: HH:mm:ss.SSS}</green> | <level>{level: <8}</level>- <level>
 logger.add(sys.stderr, level="INFO", format=fmt)
 
 
+# The async and sync APIs are only imported once one of their symbols is accessed,
+# so that using one of them doesn't pay for importing the other.
+_LAZY_IMPORTS = {
+    "AsyncDendrite": "dendrite.async_api",
+    "AsyncElement": "dendrite.async_api",
+    "AsyncPage": "dendrite.async_api",
+    "AsyncElementsResponse": "dendrite.async_api",
+    "Dendrite": "dendrite.sync_api",
+    "Element": "dendrite.sync_api",
+    "Page": "dendrite.sync_api",
+    "ElementsResponse": "dendrite.sync_api",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    # Submodules such as dendrite.sync_api used to be bound by the eager imports, so they're imported on access
+    if importlib.util.find_spec(f"{__name__}.{name}") is not None:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
 __all__ = [
     "AsyncDendrite",
     "AsyncElement",
@@ -23,6 +23,7 @@ from dendrite.async_api._core._impl_mapping import get_impl
 from dendrite.async_api._core._managers.page_manager import (
     PageManager,
 )
+from dendrite.async_api._core._managers.cache_miss_tracker import CacheMissTracker
 
 from dendrite.async_api._core._type_spec import PlaywrightPage
 from dendrite.async_api._core.dendrite_page import AsyncPage
@@ -132,6 +133,7 @@ class AsyncDendrite(
         self.closed = False
         self._auth = auth
         self._browser_api_client = BrowserAPIClient(api_config, self._id)
+        self._cache_miss_tracker = CacheMissTracker()
 
     @property
     def pages(self) -> List[AsyncPage]:
@@ -1,6 +1,6 @@
 import asyncio
 import time
-from typing import Any, Optional, Type, overload, List
+from typing import TYPE_CHECKING, Any, Optional, Tuple, Type, overload, List
 from dendrite.async_api._api.dto.extract_dto import ExtractDTO
 from dendrite.async_api._api.response.cache_extract_response import (
     CacheExtractResponse,
@@ -13,10 +13,14 @@ from dendrite.async_api._core._type_spec import (
     convert_to_type_spec,
     to_json_schema,
 )
+from dendrite.async_api._core.models.page_information import PageInformation
 from dendrite.async_api._core.protocol.page_protocol import DendritePageProtocol
 from dendrite.async_api._core._managers.navigation_tracker import NavigationTracker
 from loguru import logger
 
+if TYPE_CHECKING:
+    from dendrite.async_api._core.dendrite_page import AsyncPage
+
 
 CACHE_TIMEOUT = 5
 
@@ -133,8 +137,8 @@ class ExtractionMixin(DendritePageProtocol):
 
         # Check if a script exists in the cache
         if use_cache:
-            cache_available = await check_if_extract_cache_available(
-                self, prompt, json_schema
+            cache_available, prefetched_page_information = (
+                await check_if_extract_cache_available(self, prompt, json_schema)
             )
 
             if cache_available:
@@ -145,6 +149,7 @@ class ExtractionMixin(DendritePageProtocol):
                     json_schema,
                     remaining_timeout=CACHE_TIMEOUT,
                     only_use_cache=True,
+                    prefetched_page_information=prefetched_page_information,
                 )
                 if result:
                     return convert_and_return_result(result, type_spec)
@@ -169,7 +174,7 @@ class ExtractionMixin(DendritePageProtocol):
 
 async def check_if_extract_cache_available(
     obj: DendritePageProtocol, prompt: str, json_schema: Optional[JsonSchema]
-) -> bool:
+) -> Tuple[bool, Tuple["AsyncPage", PageInformation]]:
     page = await obj._get_page()
     page_information = await page.get_page_information(include_screenshot=False)
     dto = ExtractDTO(
@@ -181,7 +186,7 @@ async def check_if_extract_cache_available(
     cache_response: CacheExtractResponse = (
         await obj._get_browser_api_client().check_extract_cache(dto)
     )
-    return cache_response.exists
+    return cache_response.exists, (page, page_information)
 
 
 async def attempt_extraction_with_backoff(
@@ -190,6 +195,7 @@ async def attempt_extraction_with_backoff(
     json_schema: Optional[JsonSchema],
     remaining_timeout: float = 180.0,
     only_use_cache: bool = False,
+    prefetched_page_information: Optional[Tuple["AsyncPage", PageInformation]] = None,
 ) -> Optional[ExtractResponse]:
     TIMEOUT_INTERVAL: List[float] = [0.15, 0.45, 1.0, 2.0, 4.0, 8.0]
     total_elapsed_time = 0
@@ -202,9 +208,18 @@ async def attempt_extraction_with_backoff(
 
         request_start_time = time.time()
         page = await obj._get_page()
-        page_information = await page.get_page_information(
-            include_screenshot=not only_use_cache
-        )
+        # Page information prefetched by the caller is only used for the first attempt, and only if it was taken
+        # from the page we're on now
+        if (
+            prefetched_page_information is not None
+            and prefetched_page_information[0] is page
+        ):
+            page_information = prefetched_page_information[1]
+        else:
+            page_information = await page.get_page_information(
+                include_screenshot=not only_use_cache
+            )
+        prefetched_page_information = None
         extract_dto = ExtractDTO(
             page_information=page_information,
             api_config=obj._get_dendrite_browser().api_config,
@@ -1,20 +1,42 @@
 import asyncio
+import contextlib
+import itertools
+import random
 import time
-from typing import Dict, List, Literal, Optional, Union, overload
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    overload,
+)
 
 from loguru import logger
+from pydantic import TypeAdapter
 
 from dendrite.async_api._api.dto.get_elements_dto import GetElementsDTO
-from dendrite.async_api._api.response.get_element_response import GetElementResponse
 from dendrite.async_api._api.dto.get_elements_dto import CheckSelectorCacheDTO
 from dendrite.async_api._core._utils import get_elements_from_selectors_soup
 from dendrite.async_api._core.dendrite_element import AsyncElement
 from dendrite.async_api._core.models.response import AsyncElementsResponse
 from dendrite.async_api._core.protocol.page_protocol import DendritePageProtocol
 from dendrite.async_api._core.models.api_config import APIConfig
+from dendrite.async_api._core.models.page_information import PageInformation
+
+if TYPE_CHECKING:
+    from dendrite.async_api._core.dendrite_page import AsyncPage
 
 
 CACHE_TIMEOUT = 5
+AGENT_MAX_ATTEMPTS = 6
+BACKOFF_MAX_SLEEP = 8.0
+MIN_ATTEMPT_TIMEOUT = 0.2
+
+# Prompts are validated once when they come in, so the DTOs built from them on every attempt can skip validation
+_prompt_adapter = TypeAdapter(Union[str, Dict[str, str]])
 
 
 class GetElementMixin(DendritePageProtocol):
@@ -199,32 +221,55 @@ class GetElementMixin(DendritePageProtocol):
             Union[AsyncElement, List[AsyncElement], AsyncElementsResponse]: The retrieved element, list of elements, or response object.
         """
 
+        prompt_or_elements = _prompt_adapter.validate_python(prompt_or_elements)
         api_config = self._get_dendrite_browser().api_config
-        start_time = time.time()
+        start_time = time.monotonic()
 
-        # First, let's check if there is a cached selector
         page = await self._get_page()
-        cache_available = await test_if_cache_available(
-            self, prompt_or_elements, page.url
+        prefetched_page_information: Optional[Tuple["AsyncPage", PageInformation]] = (
+            None
         )
 
-        # If we have cached elements, attempt to use them with an exponentation backoff
-        if cache_available and use_cache == True:
-            logger.info(f"Cache available, attempting to use cached selectors")
-            res = await attempt_with_backoff(
-                self,
-                prompt_or_elements,
-                only_one,
-                api_config,
-                remaining_timeout=CACHE_TIMEOUT,
-                only_use_cache=True,
+        # First, let's check if there is a cached selector
+        if use_cache == True:
+            # The page information needed by the find element agent is fetched while the cache is checked,
+            # so that a cache miss doesn't cost an extra round-trip
+            page_information_task = asyncio.create_task(
+                page.get_page_information(include_screenshot=True)
             )
-            if res:
-                return res
-            else:
-                logger.debug(
-                    f"After attempting to use cached selectors several times without success, let's find the elements using the find element agent."
+            try:
+                cache_available = await test_if_cache_available(
+                    self, prompt_or_elements, page.url
                 )
+                if not cache_available:
+                    prefetched_page_information = (page, await page_information_task)
+            finally:
+                # Unless the find element agent is going to use it, the fetch is stopped and waited for. Left running,
+                # it would keep taking a screenshot and overwrite the page's soup while the cached selectors are tried.
+                if prefetched_page_information is None:
+                    page_information_task.cancel()
+                    with contextlib.suppress(asyncio.CancelledError, Exception):
+                        await page_information_task
+
+            if cache_available:
+                # If we have cached elements, attempt to use them with an exponentation backoff
+                logger.info(f"Cache available, attempting to use cached selectors")
+                res = await attempt_with_backoff(
+                    self,
+                    prompt_or_elements,
+                    only_one,
+                    api_config,
+                    remaining_timeout=min(
+                        CACHE_TIMEOUT, timeout - (time.monotonic() - start_time)
+                    ),
+                    only_use_cache=True,
+                )
+                if res:
+                    return res
+                else:
+                    logger.debug(
+                        f"After attempting to use cached selectors several times without success, let's find the elements using the find element agent."
+                    )
 
         # Now that no cached selectors were found or they failed repeatedly, let's use the find element agent to find the requested elements.
         logger.info(
@@ -235,10 +280,15 @@ class GetElementMixin(DendritePageProtocol):
             prompt_or_elements,
             only_one,
             api_config,
-            remaining_timeout=timeout - (time.time() - start_time),
+            remaining_timeout=timeout - (time.monotonic() - start_time),
             only_use_cache=False,
+            prefetched_page_information=prefetched_page_information,
         )
         if res:
+            # The find element agent's selectors are cached now, so don't skip the next cache check
+            self._get_dendrite_browser()._cache_miss_tracker.forget(
+                page.url, prompt_or_elements
+            )
             return res
 
         logger.error(
@@ -250,12 +300,22 @@ class GetElementMixin(DendritePageProtocol):
 async def test_if_cache_available(
     obj: DendritePageProtocol, prompt_or_elements: Union[str, Dict[str, str]], url: str
 ) -> bool:
-    dto = CheckSelectorCacheDTO(
+    # Skip the round-trip if the cache was empty for this page and prompt moments ago
+    cache_miss_tracker = obj._get_dendrite_browser()._cache_miss_tracker
+    if cache_miss_tracker.is_recent_miss(url, prompt_or_elements):
+        return False
+
+    dto = CheckSelectorCacheDTO.model_construct(
         url=url,
         prompt=prompt_or_elements,
     )
     cache_available = await obj._get_browser_api_client().check_selector_cache(dto)
 
+    if cache_available.exists:
+        cache_miss_tracker.forget(url, prompt_or_elements)
+    else:
+        cache_miss_tracker.record_miss(url, prompt_or_elements)
+
     return cache_available.exists
 
 
@@ -266,22 +326,44 @@ async def attempt_with_backoff(
     api_config: APIConfig,
     remaining_timeout: float,
     only_use_cache: bool = False,
+    prefetched_page_information: Optional[Tuple["AsyncPage", PageInformation]] = None,
 ) -> Union[Optional[AsyncElement], List[AsyncElement], AsyncElementsResponse]:
-    TIMEOUT_INTERVAL: List[float] = [0.15, 0.45, 1.0, 2.0, 4.0, 8.0]
-    total_elapsed_time = 0
-    start_time = time.time()
+    # Don't spend a round-trip on an attempt that would be cut short by the timeout anyway
+    if remaining_timeout <= MIN_ATTEMPT_TIMEOUT:
+        logger.opt(lazy=True).debug(
+            "Skipping attempt, only {:.2f} seconds remaining",
+            lambda: max(0, remaining_timeout),
+        )
+        return None
 
-    for current_timeout in TIMEOUT_INTERVAL:
-        if total_elapsed_time >= remaining_timeout:
-            logger.error(f"Timeout reached after {total_elapsed_time:.2f} seconds")
-            return None
+    # All attempts and the sleeps between them share a single budget that ends at the deadline
+    start_time = time.monotonic()
+    deadline = start_time + remaining_timeout
+    # Exponentially weighted moving average of the request round-trip time, used to pace the retries
+    ewma_rtt: Optional[float] = None
+
+    # Cache attempts continue until the deadline, so the whole budget is used however fast the server responds
+    for attempt in itertools.count():
+        request_start_time = time.monotonic()
 
-        request_start_time = time.time()
+        # The page is resolved on every attempt since the active page of a browser may change between retries
         page = await obj._get_page()
-        page_information = await page.get_page_information(
-            include_screenshot=not only_use_cache
-        )
-        dto = GetElementsDTO(
+
+        # Page information prefetched by the caller is only used for the first attempt, and only if it was taken
+        # from the page we're on now. Retries always fetch it again, since they are waiting for the page to change.
+        if (
+            prefetched_page_information is not None
+            and prefetched_page_information[0] is page
+        ):
+            page_information = prefetched_page_information[1]
+        else:
+            page_information = await page.get_page_information(
+                include_screenshot=not only_use_cache
+            )
+        prefetched_page_information = None
+
+        # The prompt was validated by _get_element and the rest was built by us, so validation can be skipped
+        dto = GetElementsDTO.model_construct(
             page_information=page_information,
             prompt=prompt_or_elements,
             api_config=api_config,
@@ -289,12 +371,20 @@ async def attempt_with_backoff(
             only_one=only_one,
             force_use_cache=only_use_cache,
         )
+
         res = await obj._get_browser_api_client().get_interactions_selector(dto)
-        request_duration = time.time() - request_start_time
+        request_duration = time.monotonic() - request_start_time
+        ewma_rtt = (
+            request_duration
+            if ewma_rtt is None
+            else 0.3 * request_duration + 0.7 * ewma_rtt
+        )
 
         if res.status == "impossible":
-            logger.error(
-                f"Impossible to get elements for '{prompt_or_elements}'. Reason: {res.message}"
+            logger.opt(lazy=True).error(
+                "Impossible to get elements for '{}'. Reason: {}",
+                lambda: prompt_or_elements,
+                lambda: res.message,
             )
             return None
 
@@ -305,36 +395,36 @@ async def attempt_with_backoff(
             if response:
                 return response
 
-        sleep_duration = max(0, current_timeout - request_duration)
-        logger.info(
-            f"Failed to get elements for prompt:\n\n'{prompt_or_elements}'\n\nStatus: {res.status}\n\nMessage: {res.message}\n\nSleeping for {sleep_duration:.2f} seconds"
+        # Every find element agent attempt runs an LLM call on the server, so their number is capped
+        if not only_use_cache and attempt + 1 >= AGENT_MAX_ATTEMPTS:
+            break
+
+        # The interval is measured from the start of the attempt, so a slow request doesn't delay the next one further.
+        # The next attempt must also be expected to finish before the deadline, otherwise there's no point in waiting for it.
+        sleep_duration = min(
+            max(
+                0,
+                ewma_rtt * (1.5**attempt)
+                + random.uniform(0, 0.1 * ewma_rtt)
+                - request_duration,
+            ),
+            BACKOFF_MAX_SLEEP,
+            deadline - time.monotonic() - ewma_rtt,
+        )
+        if sleep_duration < 0:
+            break
+
+        logger.opt(lazy=True).info(
+            "Failed to get elements for prompt:\n\n'{}'\n\nStatus: {}\n\nMessage: {}\n\nSleeping for {:.2f} seconds",
+            lambda: prompt_or_elements,
+            lambda: res.status,
+            lambda: res.message,
+            lambda: sleep_duration,
         )
         await asyncio.sleep(sleep_duration)
-        total_elapsed_time = time.time() - start_time
-
-    logger.error(f"All attempts failed after {total_elapsed_time:.2f} seconds")
-    return None
-
-
-async def get_elements_from_selectors(
-    obj: DendritePageProtocol, res: GetElementResponse, only_one: bool
-) -> Union[Optional[AsyncElement], List[AsyncElement], AsyncElementsResponse]:
-    if isinstance(res.selectors, dict):
-        result = {}
-        for key, selectors in res.selectors.items():
-            for selector in selectors:
-                page = await obj._get_page()
-                dendrite_elements = await page._get_all_elements_from_selector(selector)
-                if len(dendrite_elements) > 0:
-                    result[key] = dendrite_elements[0]
-                    break
-        return AsyncElementsResponse(result)
-    elif isinstance(res.selectors, list):
-        for selector in reversed(res.selectors):
-            page = await obj._get_page()
-            dendrite_elements = await page._get_all_elements_from_selector(selector)
-
-            if len(dendrite_elements) > 0:
-                return dendrite_elements[0] if only_one else dendrite_elements
 
+    logger.opt(lazy=True).error(
+        "All attempts failed after {:.2f} seconds",
+        lambda: time.monotonic() - start_time,
+    )
     return None
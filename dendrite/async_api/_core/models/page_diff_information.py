@@ -1,7 +1,8 @@
-from pydantic import BaseModel
+from dataclasses import dataclass
 from dendrite.async_api._core.models.page_information import PageInformation
 
 
-class PageDiffInformation(BaseModel):
+@dataclass(frozen=True)
+class PageDiffInformation:
     page_before: PageInformation
     page_after: PageInformation
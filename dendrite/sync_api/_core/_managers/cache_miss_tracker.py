@@ -0,0 +1,49 @@
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Tuple, Union
+
+
+class CacheMissTracker:
+    """
+    Remembers, for a short time, which (url, prompt) pairs the selector cache
+    had no entry for, so that the cache doesn't have to be asked again right away.
+
+    Each browser has its own tracker, since the cache is tied to its API config.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 2.0,
+        max_size: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._clock = clock
+        self._misses: "OrderedDict[Tuple[str, Hashable], float]" = OrderedDict()
+
+    def is_recent_miss(
+        self, url: str, prompt_or_elements: Union[str, Dict[str, str]]
+    ) -> bool:
+        missed_at = self._misses.get(self._get_key(url, prompt_or_elements))
+        return missed_at is not None and self._clock() - missed_at < self.ttl
+
+    def record_miss(
+        self, url: str, prompt_or_elements: Union[str, Dict[str, str]]
+    ) -> None:
+        key = self._get_key(url, prompt_or_elements)
+        self._misses[key] = self._clock()
+        self._misses.move_to_end(key)
+        if len(self._misses) > self.max_size:
+            self._misses.popitem(last=False)
+
+    def forget(self, url: str, prompt_or_elements: Union[str, Dict[str, str]]) -> None:
+        self._misses.pop(self._get_key(url, prompt_or_elements), None)
+
+    @staticmethod
+    def _get_key(
+        url: str, prompt_or_elements: Union[str, Dict[str, str]]
+    ) -> Tuple[str, Hashable]:
+        if isinstance(prompt_or_elements, str):
+            return (url, prompt_or_elements)
+        return (url, frozenset(prompt_or_elements.items()))
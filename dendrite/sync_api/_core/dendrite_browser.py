@@ -20,6 +20,7 @@ from dendrite.sync_api._common.event_sync import EventSync
 from dendrite.sync_api._core._impl_browser import ImplBrowser
 from dendrite.sync_api._core._impl_mapping import get_impl
 from dendrite.sync_api._core._managers.page_manager import PageManager
+from dendrite.sync_api._core._managers.cache_miss_tracker import CacheMissTracker
 from dendrite.sync_api._core._type_spec import PlaywrightPage
 from dendrite.sync_api._core.dendrite_page import Page
 from dendrite.sync_api._common.constants import STEALTH_ARGS
@@ -118,6 +119,7 @@ class Dendrite(
         self.closed = False
         self._auth = auth
         self._browser_api_client = BrowserAPIClient(api_config, self._id)
+        self._cache_miss_tracker = CacheMissTracker()
 
     @property
     def pages(self) -> List[Page]:
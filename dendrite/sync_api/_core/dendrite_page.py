@@ -55,13 +55,13 @@ class Page(
         self.dendrite_browser = dendrite_browser
         self._browser_api_client = browser_api_client
         self._last_main_frame_url = page.url
-        self._last_frame_navigated_timestamp = time.time()
+        self._last_frame_navigated_timestamp = time.monotonic()
         self.playwright_page.on("framenavigated", self._on_frame_navigated)
 
     def _on_frame_navigated(self, frame):
         if frame is self.playwright_page.main_frame:
             self._last_main_frame_url = frame.url
-            self._last_frame_navigated_timestamp = time.time()
+            self._last_frame_navigated_timestamp = time.monotonic()
 
     @property
     def url(self):
@@ -359,7 +359,7 @@ class Page(
         Returns:
             float: The number of seconds elapsed since the last URL change.
         """
-        return time.time() - self._last_frame_navigated_timestamp
+        return time.monotonic() - self._last_frame_navigated_timestamp
 
     def check_if_renavigated(self, initial_url: str, wait_time: float = 0.1) -> bool:
         """
@@ -1,6 +1,6 @@
 import time
 import time
-from typing import Any, Optional, Type, overload, List
+from typing import TYPE_CHECKING, Any, Optional, Tuple, Type, overload, List
 from dendrite.sync_api._api.dto.extract_dto import ExtractDTO
 from dendrite.sync_api._api.response.cache_extract_response import CacheExtractResponse
 from dendrite.sync_api._api.response.extract_response import ExtractResponse
@@ -11,10 +11,13 @@ from dendrite.sync_api._core._type_spec import (
     convert_to_type_spec,
     to_json_schema,
 )
+from dendrite.sync_api._core.models.page_information import PageInformation
 from dendrite.sync_api._core.protocol.page_protocol import DendritePageProtocol
 from dendrite.sync_api._core._managers.navigation_tracker import NavigationTracker
 from loguru import logger
 
+if TYPE_CHECKING:
+    from dendrite.sync_api._core.dendrite_page import Page
 CACHE_TIMEOUT = 5
 
 
@@ -124,8 +127,8 @@ class ExtractionMixin(DendritePageProtocol):
         navigation_tracker = NavigationTracker(page)
         navigation_tracker.start_nav_tracking()
         if use_cache:
-            cache_available = check_if_extract_cache_available(
-                self, prompt, json_schema
+            cache_available, prefetched_page_information = (
+                check_if_extract_cache_available(self, prompt, json_schema)
             )
             if cache_available:
                 logger.info("Cache available, attempting to use cached extraction")
@@ -135,6 +138,7 @@ class ExtractionMixin(DendritePageProtocol):
                     json_schema,
                     remaining_timeout=CACHE_TIMEOUT,
                     only_use_cache=True,
+                    prefetched_page_information=prefetched_page_information,
                 )
                 if result:
                     return convert_and_return_result(result, type_spec)
@@ -156,7 +160,7 @@ class ExtractionMixin(DendritePageProtocol):
 
 def check_if_extract_cache_available(
     obj: DendritePageProtocol, prompt: str, json_schema: Optional[JsonSchema]
-) -> bool:
+) -> Tuple[bool, Tuple["Page", PageInformation]]:
     page = obj._get_page()
     page_information = page.get_page_information(include_screenshot=False)
     dto = ExtractDTO(
@@ -168,7 +172,7 @@ def check_if_extract_cache_available(
     cache_response: CacheExtractResponse = (
         obj._get_browser_api_client().check_extract_cache(dto)
     )
-    return cache_response.exists
+    return (cache_response.exists, (page, page_information))
 
 
 def attempt_extraction_with_backoff(
@@ -177,6 +181,7 @@ def attempt_extraction_with_backoff(
     json_schema: Optional[JsonSchema],
     remaining_timeout: float = 180.0,
     only_use_cache: bool = False,
+    prefetched_page_information: Optional[Tuple["Page", PageInformation]] = None,
 ) -> Optional[ExtractResponse]:
     TIMEOUT_INTERVAL: List[float] = [0.15, 0.45, 1.0, 2.0, 4.0, 8.0]
     total_elapsed_time = 0
@@ -187,9 +192,16 @@ def attempt_extraction_with_backoff(
             return None
         request_start_time = time.time()
         page = obj._get_page()
-        page_information = page.get_page_information(
-            include_screenshot=not only_use_cache
-        )
+        if (
+            prefetched_page_information is not None
+            and prefetched_page_information[0] is page
+        ):
+            page_information = prefetched_page_information[1]
+        else:
+            page_information = page.get_page_information(
+                include_screenshot=not only_use_cache
+            )
+        prefetched_page_information = None
         extract_dto = ExtractDTO(
             page_information=page_information,
             api_config=obj._get_dendrite_browser().api_config,
@@ -1,17 +1,27 @@
 import time
+import contextlib
+import itertools
+import random
 import time
-from typing import Dict, List, Literal, Optional, Union, overload
+from typing import TYPE_CHECKING, Dict, List, Literal, Optional, Tuple, Union, overload
 from loguru import logger
+from pydantic import TypeAdapter
 from dendrite.sync_api._api.dto.get_elements_dto import GetElementsDTO
-from dendrite.sync_api._api.response.get_element_response import GetElementResponse
 from dendrite.sync_api._api.dto.get_elements_dto import CheckSelectorCacheDTO
 from dendrite.sync_api._core._utils import get_elements_from_selectors_soup
 from dendrite.sync_api._core.dendrite_element import Element
 from dendrite.sync_api._core.models.response import ElementsResponse
 from dendrite.sync_api._core.protocol.page_protocol import DendritePageProtocol
 from dendrite.sync_api._core.models.api_config import APIConfig
+from dendrite.sync_api._core.models.page_information import PageInformation
 
+if TYPE_CHECKING:
+    from dendrite.sync_api._core.dendrite_page import Page
 CACHE_TIMEOUT = 5
+AGENT_MAX_ATTEMPTS = 6
+BACKOFF_MAX_SLEEP = 8.0
+MIN_ATTEMPT_TIMEOUT = 0.2
+_prompt_adapter = TypeAdapter(Union[str, Dict[str, str]])
 
 
 class GetElementMixin(DendritePageProtocol):
@@ -181,26 +191,38 @@ class GetElementMixin(DendritePageProtocol):
         Returns:
             Union[Element, List[Element], ElementsResponse]: The retrieved element, list of elements, or response object.
         """
+        prompt_or_elements = _prompt_adapter.validate_python(prompt_or_elements)
         api_config = self._get_dendrite_browser().api_config
-        start_time = time.time()
+        start_time = time.monotonic()
         page = self._get_page()
-        cache_available = test_if_cache_available(self, prompt_or_elements, page.url)
-        if cache_available and use_cache == True:
-            logger.info(f"Cache available, attempting to use cached selectors")
-            res = attempt_with_backoff(
-                self,
-                prompt_or_elements,
-                only_one,
-                api_config,
-                remaining_timeout=CACHE_TIMEOUT,
-                only_use_cache=True,
+        prefetched_page_information: Optional[Tuple["Page", PageInformation]] = None
+        if use_cache == True:
+            cache_available = test_if_cache_available(
+                self, prompt_or_elements, page.url
             )
-            if res:
-                return res
-            else:
-                logger.debug(
-                    f"After attempting to use cached selectors several times without success, let's find the elements using the find element agent."
+            if not cache_available:
+                prefetched_page_information = (
+                    page,
+                    page.get_page_information(include_screenshot=True),
                 )
+            if cache_available:
+                logger.info(f"Cache available, attempting to use cached selectors")
+                res = attempt_with_backoff(
+                    self,
+                    prompt_or_elements,
+                    only_one,
+                    api_config,
+                    remaining_timeout=min(
+                        CACHE_TIMEOUT, timeout - (time.monotonic() - start_time)
+                    ),
+                    only_use_cache=True,
+                )
+                if res:
+                    return res
+                else:
+                    logger.debug(
+                        f"After attempting to use cached selectors several times without success, let's find the elements using the find element agent."
+                    )
         logger.info(
             "Proceeding to use the find element agent to find the requested elements."
         )
@@ -209,10 +231,14 @@ class GetElementMixin(DendritePageProtocol):
             prompt_or_elements,
             only_one,
             api_config,
-            remaining_timeout=timeout - (time.time() - start_time),
+            remaining_timeout=timeout - (time.monotonic() - start_time),
             only_use_cache=False,
+            prefetched_page_information=prefetched_page_information,
         )
         if res:
+            self._get_dendrite_browser()._cache_miss_tracker.forget(
+                page.url, prompt_or_elements
+            )
             return res
         logger.error(
             f"Failed to retrieve elements within the specified timeout of {timeout} seconds"
@@ -223,8 +249,15 @@ class GetElementMixin(DendritePageProtocol):
 def test_if_cache_available(
     obj: DendritePageProtocol, prompt_or_elements: Union[str, Dict[str, str]], url: str
 ) -> bool:
-    dto = CheckSelectorCacheDTO(url=url, prompt=prompt_or_elements)
+    cache_miss_tracker = obj._get_dendrite_browser()._cache_miss_tracker
+    if cache_miss_tracker.is_recent_miss(url, prompt_or_elements):
+        return False
+    dto = CheckSelectorCacheDTO.model_construct(url=url, prompt=prompt_or_elements)
     cache_available = obj._get_browser_api_client().check_selector_cache(dto)
+    if cache_available.exists:
+        cache_miss_tracker.forget(url, prompt_or_elements)
+    else:
+        cache_miss_tracker.record_miss(url, prompt_or_elements)
     return cache_available.exists
 
 
@@ -235,20 +268,31 @@ def attempt_with_backoff(
     api_config: APIConfig,
     remaining_timeout: float,
     only_use_cache: bool = False,
+    prefetched_page_information: Optional[Tuple["Page", PageInformation]] = None,
 ) -> Union[Optional[Element], List[Element], ElementsResponse]:
-    TIMEOUT_INTERVAL: List[float] = [0.15, 0.45, 1.0, 2.0, 4.0, 8.0]
-    total_elapsed_time = 0
-    start_time = time.time()
-    for current_timeout in TIMEOUT_INTERVAL:
-        if total_elapsed_time >= remaining_timeout:
-            logger.error(f"Timeout reached after {total_elapsed_time:.2f} seconds")
-            return None
-        request_start_time = time.time()
-        page = obj._get_page()
-        page_information = page.get_page_information(
-            include_screenshot=not only_use_cache
+    if remaining_timeout <= MIN_ATTEMPT_TIMEOUT:
+        logger.opt(lazy=True).debug(
+            "Skipping attempt, only {:.2f} seconds remaining",
+            lambda: max(0, remaining_timeout),
         )
-        dto = GetElementsDTO(
+        return None
+    start_time = time.monotonic()
+    deadline = start_time + remaining_timeout
+    ewma_rtt: Optional[float] = None
+    for attempt in itertools.count():
+        request_start_time = time.monotonic()
+        page = obj._get_page()
+        if (
+            prefetched_page_information is not None
+            and prefetched_page_information[0] is page
+        ):
+            page_information = prefetched_page_information[1]
+        else:
+            page_information = page.get_page_information(
+                include_screenshot=not only_use_cache
+            )
+        prefetched_page_information = None
+        dto = GetElementsDTO.model_construct(
             page_information=page_information,
             prompt=prompt_or_elements,
             api_config=api_config,
@@ -257,10 +301,17 @@ def attempt_with_backoff(
             force_use_cache=only_use_cache,
         )
         res = obj._get_browser_api_client().get_interactions_selector(dto)
-        request_duration = time.time() - request_start_time
+        request_duration = time.monotonic() - request_start_time
+        ewma_rtt = (
+            request_duration
+            if ewma_rtt is None
+            else 0.3 * request_duration + 0.7 * ewma_rtt
+        )
         if res.status == "impossible":
-            logger.error(
-                f"Impossible to get elements for '{prompt_or_elements}'. Reason: {res.message}"
+            logger.opt(lazy=True).error(
+                "Impossible to get elements for '{}'. Reason: {}",
+                lambda: prompt_or_elements,
+                lambda: res.message,
             )
             return None
         if res.status == "success":
@@ -269,33 +320,30 @@ def attempt_with_backoff(
             )
             if response:
                 return response
-        sleep_duration = max(0, current_timeout - request_duration)
-        logger.info(
-            f"Failed to get elements for prompt:\n\n'{prompt_or_elements}'\n\nStatus: {res.status}\n\nMessage: {res.message}\n\nSleeping for {sleep_duration:.2f} seconds"
+        if not only_use_cache and attempt + 1 >= AGENT_MAX_ATTEMPTS:
+            break
+        sleep_duration = min(
+            max(
+                0,
+                ewma_rtt * 1.5**attempt
+                + random.uniform(0, 0.1 * ewma_rtt)
+                - request_duration,
+            ),
+            BACKOFF_MAX_SLEEP,
+            deadline - time.monotonic() - ewma_rtt,
+        )
+        if sleep_duration < 0:
+            break
+        logger.opt(lazy=True).info(
+            "Failed to get elements for prompt:\n\n'{}'\n\nStatus: {}\n\nMessage: {}\n\nSleeping for {:.2f} seconds",
+            lambda: prompt_or_elements,
+            lambda: res.status,
+            lambda: res.message,
+            lambda: sleep_duration,
         )
         time.sleep(sleep_duration)
-        total_elapsed_time = time.time() - start_time
-    logger.error(f"All attempts failed after {total_elapsed_time:.2f} seconds")
-    return None
-
-
-def get_elements_from_selectors(
-    obj: DendritePageProtocol, res: GetElementResponse, only_one: bool
-) -> Union[Optional[Element], List[Element], ElementsResponse]:
-    if isinstance(res.selectors, dict):
-        result = {}
-        for key, selectors in res.selectors.items():
-            for selector in selectors:
-                page = obj._get_page()
-                dendrite_elements = page._get_all_elements_from_selector(selector)
-                if len(dendrite_elements) > 0:
-                    result[key] = dendrite_elements[0]
-                    break
-        return ElementsResponse(result)
-    elif isinstance(res.selectors, list):
-        for selector in reversed(res.selectors):
-            page = obj._get_page()
-            dendrite_elements = page._get_all_elements_from_selector(selector)
-            if len(dendrite_elements) > 0:
-                return dendrite_elements[0] if only_one else dendrite_elements
+    logger.opt(lazy=True).error(
+        "All attempts failed after {:.2f} seconds",
+        lambda: time.monotonic() - start_time,
+    )
     return None
@@ -4,7 +4,7 @@ import shutil
 import logging
 import subprocess
 import sys
-from typing import Dict, Any
+from typing import Dict, Any, Set
 
 logging.basicConfig(level=logging.WARNING)
 
@@ -61,6 +61,128 @@ class AsyncToSyncTransformer(ast.NodeTransformer):
         super().__init__()
         self.unconverted_nodes = []
         self.renames = renames
+        # Names bound to 'asyncio.create_task(...)', mapped to the awaitable they wrap
+        self.deferred_tasks: Dict[str, ast.expr] = {}
+        # Deferred tasks that have been cancelled, and so are never run
+        self.cancelled_tasks: Set[str] = set()
+
+    def visit_Module(self, node):
+        self.generic_visit(node)
+        # Removing statements (e.g. 'task.cancel()') must not leave a block empty
+        for child in ast.walk(node):
+            if (
+                not isinstance(child, ast.Module)
+                and isinstance(getattr(child, "body", None), list)
+                and not child.body
+            ):
+                child.body = [ast.Pass()]
+        return node
+
+    def visit_Assign(self, node):
+        # Replace 'task = asyncio.create_task(coro)' by running 'coro' where the task is awaited
+        if (
+            len(node.targets) == 1
+            and isinstance(node.targets[0], ast.Name)
+            and self._is_asyncio_call(node.value, "create_task")
+            and len(node.value.args) == 1
+            and not node.value.keywords
+        ):
+            self.deferred_tasks[node.targets[0].id] = self.visit(node.value.args[0])
+            return None
+        return self.generic_visit(node)
+
+    def visit_If(self, node):
+        self.generic_visit(node)
+        # An 'if' left without statements is dropped, as long as evaluating its test can't have side effects
+        if not node.body and not node.orelse and self._is_side_effect_free(node.test):
+            return None
+        if not node.body:
+            node.body = [ast.Pass()]
+        return node
+
+    def visit_With(self, node):
+        self.generic_visit(node)
+        # 'with contextlib.suppress(...)' left without statements has nothing left to suppress
+        if not node.body and all(
+            item.optional_vars is None and self._is_suppress_call(item.context_expr)
+            for item in node.items
+        ):
+            return None
+        return node
+
+    def visit_Try(self, node):
+        self.generic_visit(node)
+        for handler in node.handlers:
+            if not handler.body:
+                handler.body = [ast.Pass()]
+        if not node.body:
+            node.body = [ast.Pass()]
+        # A 'try' whose 'finally' block is left empty and has no handlers is replaced by its body
+        if not node.finalbody and not node.handlers:
+            return node.body
+        return node
+
+    def visit_Expr(self, node):
+        # Cancelling a deferred task means never running it
+        if (
+            isinstance(node.value, ast.Call)
+            and isinstance(node.value.func, ast.Attribute)
+            and node.value.func.attr == "cancel"
+            and isinstance(node.value.func.value, ast.Name)
+            and node.value.func.value.id in self.deferred_tasks
+        ):
+            self.cancelled_tasks.add(node.value.func.value.id)
+            return None
+        # Awaiting a cancelled task only waits for it to stop, and the deferred one never started
+        if (
+            isinstance(node.value, ast.Await)
+            and isinstance(node.value.value, ast.Name)
+            and node.value.value.id in self.cancelled_tasks
+        ):
+            return None
+        return self.generic_visit(node)
+
+    @staticmethod
+    def _is_side_effect_free(node) -> bool:
+        return all(
+            isinstance(
+                child,
+                (
+                    ast.Name,
+                    ast.Constant,
+                    ast.Compare,
+                    ast.Is,
+                    ast.IsNot,
+                    ast.BoolOp,
+                    ast.And,
+                    ast.Or,
+                    ast.UnaryOp,
+                    ast.Not,
+                    ast.Load,
+                ),
+            )
+            for child in ast.walk(node)
+        )
+
+    @staticmethod
+    def _is_suppress_call(node) -> bool:
+        return (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and isinstance(node.func.value, ast.Name)
+            and node.func.value.id == "contextlib"
+            and node.func.attr == "suppress"
+        )
+
+    @staticmethod
+    def _is_asyncio_call(node, attr: str) -> bool:
+        return (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and isinstance(node.func.value, ast.Name)
+            and node.func.value.id == "asyncio"
+            and node.func.attr == attr
+        )
 
     def visit_AsyncFunctionDef(self, node):
         # Remove 'async' from function definitions
@@ -90,6 +212,10 @@ class AsyncToSyncTransformer(ast.NodeTransformer):
         return new_node
 
     def visit_Await(self, node):
+        # Awaiting a deferred task runs its awaitable in place
+        if isinstance(node.value, ast.Name) and node.value.id in self.deferred_tasks:
+            return self.deferred_tasks[node.value.id]
+
         # Remove 'await' from 'await' expressions
         self.generic_visit(node)
         return node.value  # Remove the Await node, keep the value
@@ -171,6 +297,13 @@ class AsyncToSyncTransformer(ast.NodeTransformer):
             if isinstance(node.func.value, ast.Name):
                 if node.func.value.id == "asyncio" and node.func.attr == "sleep":
                     node.func.value.id = "time"  # Replace 'asyncio' with 'time'
+                elif (
+                    node.func.value.id == "asyncio" and node.func.attr == "create_task"
+                ):
+                    logging.warning(
+                        f"Cannot convert asyncio.create_task outside of 'task = asyncio.create_task(...)' at line {node.lineno}"
+                    )
+                    self.unconverted_nodes.append(node)
                 elif node.func.value.id == "httpx" and node.func.attr == "AsyncClient":
                     node.func.attr = "Client"  # Replace 'AsyncClient' with 'Client'
         return node
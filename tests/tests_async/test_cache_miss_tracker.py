@@ -0,0 +1,156 @@
+import pytest
+
+from dendrite.async_api._api.response.selector_cache_response import (
+    SelectorCacheResponse,
+)
+from dendrite.async_api._core._managers.cache_miss_tracker import CacheMissTracker
+from dendrite.async_api._core.mixin import get_element
+from dendrite.async_api._core.mixin.get_element import (
+    GetElementMixin,
+    test_if_cache_available as check_cache_available,
+)
+from dendrite.async_api._core.models.api_config import APIConfig
+
+
+class FakeClock:
+    """A monotonic clock that only moves when told to."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_recent_miss_expires_after_ttl(clock):
+    tracker = CacheMissTracker(ttl=2.0, clock=clock)
+    tracker.record_miss("https://example.com", "The main heading")
+
+    assert tracker.is_recent_miss("https://example.com", "The main heading")
+    assert not tracker.is_recent_miss("https://example.com", "Another prompt")
+    assert not tracker.is_recent_miss("https://example.org", "The main heading")
+
+    clock.now += 2.0
+    assert not tracker.is_recent_miss("https://example.com", "The main heading")
+
+
+def test_dict_prompts_are_keyed_by_their_items(clock):
+    tracker = CacheMissTracker(clock=clock)
+    tracker.record_miss("https://example.com", {"a": "first", "b": "second"})
+
+    assert tracker.is_recent_miss("https://example.com", {"b": "second", "a": "first"})
+    assert not tracker.is_recent_miss("https://example.com", {"a": "first"})
+
+
+def test_forget_removes_miss(clock):
+    tracker = CacheMissTracker(clock=clock)
+    tracker.record_miss("https://example.com", "The main heading")
+    tracker.forget("https://example.com", "The main heading")
+    tracker.forget("https://example.com", "Never recorded")
+
+    assert not tracker.is_recent_miss("https://example.com", "The main heading")
+
+
+def test_least_recently_recorded_miss_is_evicted(clock):
+    tracker = CacheMissTracker(max_size=2, clock=clock)
+    tracker.record_miss("https://example.com", "first")
+    tracker.record_miss("https://example.com", "second")
+    tracker.record_miss("https://example.com", "first")
+    tracker.record_miss("https://example.com", "third")
+
+    assert tracker.is_recent_miss("https://example.com", "first")
+    assert not tracker.is_recent_miss("https://example.com", "second")
+    assert tracker.is_recent_miss("https://example.com", "third")
+
+
+def test_trackers_are_independent(clock):
+    tracker = CacheMissTracker(clock=clock)
+    other_tracker = CacheMissTracker(clock=clock)
+    tracker.record_miss("https://example.com", "The main heading")
+
+    assert not other_tracker.is_recent_miss("https://example.com", "The main heading")
+
+
+class StubAPIClient:
+    """Answers selector cache checks with a fixed result and counts them."""
+
+    def __init__(self, exists: bool):
+        self.exists = exists
+        self.cache_checks = 0
+
+    async def check_selector_cache(self, dto) -> SelectorCacheResponse:
+        self.cache_checks += 1
+        return SelectorCacheResponse(exists=self.exists)
+
+
+class StubPage:
+    url = "https://example.com"
+
+    async def get_page_information(self, include_screenshot: bool = True):
+        return None
+
+
+class StubBrowser:
+    def __init__(self, clock):
+        self.api_config = APIConfig(dendrite_api_key="your_dendrite_api_key")
+        self._cache_miss_tracker = CacheMissTracker(clock=clock)
+
+
+class StubMixin(GetElementMixin):
+    def __init__(self, api_client: StubAPIClient, clock):
+        self.api_client = api_client
+        self.browser = StubBrowser(clock)
+        self.page = StubPage()
+
+    async def _get_page(self):
+        return self.page
+
+    def _get_dendrite_browser(self):
+        return self.browser
+
+    def _get_browser_api_client(self):
+        return self.api_client
+
+
+@pytest.mark.asyncio
+async def test_cache_check_is_skipped_after_recent_miss(clock):
+    api_client = StubAPIClient(exists=False)
+    obj = StubMixin(api_client, clock)
+
+    assert not await check_cache_available(obj, "The main heading", StubPage.url)
+    assert not await check_cache_available(obj, "The main heading", StubPage.url)
+    assert api_client.cache_checks == 1
+
+    clock.now += 2.0
+    assert not await check_cache_available(obj, "The main heading", StubPage.url)
+    assert api_client.cache_checks == 2
+
+
+@pytest.mark.asyncio
+async def test_successful_agent_run_forgets_miss(clock, monkeypatch):
+    async def find_element(*args, **kwargs):
+        return "element"
+
+    monkeypatch.setattr(get_element, "attempt_with_backoff", find_element)
+    api_client = StubAPIClient(exists=False)
+    obj = StubMixin(api_client, clock)
+
+    assert (
+        await obj._get_element(
+            "The main heading", only_one=True, use_cache=True, timeout=15000
+        )
+        == "element"
+    )
+    assert api_client.cache_checks == 1
+
+    # The agent's selectors are cached now, so the next call asks the cache again
+    assert not obj.browser._cache_miss_tracker.is_recent_miss(
+        StubPage.url, "The main heading"
+    )
+    await check_cache_available(obj, "The main heading", StubPage.url)
+    assert api_client.cache_checks == 2